@@ -1,18 +1,93 @@
 """
 配置管理模块
 """
+import copy
 import json
 import os
+import sys
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _loads(data: bytes) -> Any:
+    """解析JSON字节串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps(obj: Any) -> bytes:
+    """序列化为带缩进的UTF-8 JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=16)
+def _read_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    读取并解析配置文件（按路径、修改时间和大小缓存）
+
+    文件内容变化时 mtime/size 随之变化，缓存自然失效。
+    返回的字典为共享对象，调用方需自行复制后再修改。
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
 class ConfigManager:
     """配置管理器"""
 
+    # 交易所必填项: (配置键, 错误消息)
+    _EXCHANGE_REQUIRED = (
+        ('exchange', "交易所类型未配置"),
+        ('api_key', "API Key未配置"),
+        ('secret', "API Secret未配置"),
+    )
+
+    # 数值范围规则: (配置键, 默认值, 校验函数, 错误模板)
+    _RANGE_RULES = (
+        ('investment', 0, lambda v: v > 0, "投资金额应大于0，当前: {v}"),
+        ('position_ratio', 0, lambda v: 0 < v <= 1, "仓位比例应在0-100%之间，当前: {pct}%"),
+        ('leverage', 1, lambda v: 1 <= v <= 125, "杠杆倍数应在1-125之间，当前: {v}"),
+        ('atr_period', 14, lambda v: 1 <= v <= 100, "ATR周期应在1-100之间，当前: {v}"),
+    )
+
+    # ATR支持的K线周期（元组保留显示顺序，frozenset用于成员判断）
+    _TIMEFRAMES = ('1m', '5m', '15m', '30m', '1h', '4h', '1d')
+    _VALID_TIMEFRAMES = frozenset(_TIMEFRAMES)
+
+    # 止盈止损规则: (类型键, 类型错误模板, {类型: 数值规则})
+    _THRESHOLD_RULES = (
+        ('up_threshold_type', "上涨阈值类型应为 percent 或 atr，当前: {v}", {
+            'percent': ('up_threshold', 0, lambda v: 0 < v <= 0.5, "上涨阈值应在0-50%之间，当前: {pct}%"),
+            'atr': ('up_atr_multiplier', 0.9, lambda v: 0 < v <= 5, "上涨ATR倍数应在0-5之间，当前: {v}"),
+        }),
+        ('down_threshold_type', "下跌阈值类型应为 percent 或 atr，当前: {v}", {
+            'percent': ('down_threshold', 0, lambda v: 0 < v <= 0.5, "下跌阈值应在0-50%之间，当前: {pct}%"),
+            'atr': ('down_atr_multiplier', 0.9, lambda v: 0 < v <= 5, "下跌ATR倍数应在0-5之间，当前: {v}"),
+        }),
+        ('stop_loss_type', "止损类型应为 percent 或 atr，当前: {v}", {
+            'percent': ('stop_loss_ratio', 0, lambda v: 0 < v <= 0.5, "止损比例应在0-50%之间，当前: {pct}%"),
+            'atr': ('stop_loss_atr_multiplier', 1.5, lambda v: 0 < v <= 10, "止损ATR倍数应在0-10之间，当前: {v}"),
+        }),
+    )
+
+    # 风险控制规则
+    _LIMIT_RULES = (
+        ('max_daily_loss', 0, lambda v: v >= 0, "每日最大亏损不能为负数，当前: {v}"),
+        ('max_daily_trades', 0, lambda v: v >= 0, "每日最大交易次数不能为负数，当前: {v}"),
+        ('max_positions', 0, lambda v: 0 < v <= 20, "最大持仓对数应在1-20之间，当前: {v}"),
+    )
+
     def __init__(self, config_path: str = "config/config.json"):
         """
         初始化配置管理器
@@ -35,8 +110,9 @@ class ConfigManager:
             return False
 
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            st = os.stat(self.config_path)
+            cached = _read_config_cached(self.config_path, st.st_mtime_ns, st.st_size)
+            self.config = copy.deepcopy(cached)
             logger.info(f"配置文件加载成功: {self.config_path}")
             return True
         except Exception as e:
@@ -54,8 +130,9 @@ class ConfigManager:
             # 确保目录存在
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            with open(self.config_path, 'wb') as f:
+                f.write(_dumps(self.config))
+            _read_config_cached.cache_clear()
 
             logger.info(f"配置文件保存成功: {self.config_path}")
             return True
@@ -134,15 +211,9 @@ class ConfigManager:
 
         # 验证交易所配置
         exchange_config = self.get_exchange_config()
-
-        if not exchange_config.get('exchange'):
-            errors.append("交易所类型未配置")
-
-        if not exchange_config.get('api_key'):
-            errors.append("API Key未配置")
-
-        if not exchange_config.get('secret'):
-            errors.append("API Secret未配置")
+        for key, message in self._EXCHANGE_REQUIRED:
+            if not exchange_config.get(key):
+                errors.append(message)
 
         # 验证策略配置
         strategy_config = self.get_strategy_config()
@@ -150,82 +221,42 @@ class ConfigManager:
         if not strategy_config.get('symbol'):
             errors.append("交易对未配置")
 
-        # 验证数值范围
-        investment = strategy_config.get('investment', 0)
-        if investment <= 0:
-            errors.append(f"投资金额应大于0，当前: {investment}")
+        # 验证数值范围和ATR参数
+        self._check_rules(strategy_config, self._RANGE_RULES, errors)
 
-        position_ratio = strategy_config.get('position_ratio', 0)
-        if position_ratio <= 0 or position_ratio > 1:
-            errors.append(f"仓位比例应在0-100%之间，当前: {position_ratio*100}%")
+        atr_timeframe = strategy_config.get('atr_timeframe', '1h')
+        if atr_timeframe not in self._VALID_TIMEFRAMES:
+            errors.append(f"ATR时间周期应为 {', '.join(self._TIMEFRAMES)} 之一，当前: {atr_timeframe}")
 
-        leverage = strategy_config.get('leverage', 1)
-        if leverage < 1 or leverage > 125:
-            errors.append(f"杠杆倍数应在1-125之间，当前: {leverage}")
+        # 验证上涨止盈、下跌止盈和止损参数
+        for type_key, type_message, branches in self._THRESHOLD_RULES:
+            threshold_type = strategy_config.get(type_key, 'percent')
+            rule = branches.get(threshold_type)
+            if rule is None:
+                errors.append(type_message.format(v=threshold_type))
+            else:
+                self._check_rules(strategy_config, (rule,), errors)
 
-        # 验证ATR参数
-        atr_period = strategy_config.get('atr_period', 14)
-        if atr_period < 1 or atr_period > 100:
-            errors.append(f"ATR周期应在1-100之间，当前: {atr_period}")
-
-        atr_timeframe = strategy_config.get('atr_timeframe', '1h')
-        valid_timeframes = ['1m', '5m', '15m', '30m', '1h', '4h', '1d']
-        if atr_timeframe not in valid_timeframes:
-            errors.append(f"ATR时间周期应为 {', '.join(valid_timeframes)} 之一，当前: {atr_timeframe}")
-
-        # 验证上涨止盈参数
-        up_threshold_type = strategy_config.get('up_threshold_type', 'percent')
-        if up_threshold_type == 'percent':
-            up_threshold = strategy_config.get('up_threshold', 0)
-            if up_threshold <= 0 or up_threshold > 0.5:
-                errors.append(f"上涨阈值应在0-50%之间，当前: {up_threshold*100}%")
-        elif up_threshold_type == 'atr':
-            up_atr_multiplier = strategy_config.get('up_atr_multiplier', 0.9)
-            if up_atr_multiplier <= 0 or up_atr_multiplier > 5:
-                errors.append(f"上涨ATR倍数应在0-5之间，当前: {up_atr_multiplier}")
-        else:
-            errors.append(f"上涨阈值类型应为 percent 或 atr，当前: {up_threshold_type}")
-
-        # 验证下跌止盈参数
-        down_threshold_type = strategy_config.get('down_threshold_type', 'percent')
-        if down_threshold_type == 'percent':
-            down_threshold = strategy_config.get('down_threshold', 0)
-            if down_threshold <= 0 or down_threshold > 0.5:
-                errors.append(f"下跌阈值应在0-50%之间，当前: {down_threshold*100}%")
-        elif down_threshold_type == 'atr':
-            down_atr_multiplier = strategy_config.get('down_atr_multiplier', 0.9)
-            if down_atr_multiplier <= 0 or down_atr_multiplier > 5:
-                errors.append(f"下跌ATR倍数应在0-5之间，当前: {down_atr_multiplier}")
-        else:
-            errors.append(f"下跌阈值类型应为 percent 或 atr，当前: {down_threshold_type}")
-
-        # 验证止损参数
-        stop_loss_type = strategy_config.get('stop_loss_type', 'percent')
-        if stop_loss_type == 'percent':
-            stop_loss_ratio = strategy_config.get('stop_loss_ratio', 0)
-            if stop_loss_ratio <= 0 or stop_loss_ratio > 0.5:
-                errors.append(f"止损比例应在0-50%之间，当前: {stop_loss_ratio*100}%")
-        elif stop_loss_type == 'atr':
-            stop_loss_atr_multiplier = strategy_config.get('stop_loss_atr_multiplier', 1.5)
-            if stop_loss_atr_multiplier <= 0 or stop_loss_atr_multiplier > 10:
-                errors.append(f"止损ATR倍数应在0-10之间，当前: {stop_loss_atr_multiplier}")
-        else:
-            errors.append(f"止损类型应为 percent 或 atr，当前: {stop_loss_type}")
-
-        max_daily_loss = strategy_config.get('max_daily_loss', 0)
-        if max_daily_loss < 0:
-            errors.append(f"每日最大亏损不能为负数，当前: {max_daily_loss}")
-
-        max_daily_trades = strategy_config.get('max_daily_trades', 0)
-        if max_daily_trades < 0:
-            errors.append(f"每日最大交易次数不能为负数，当前: {max_daily_trades}")
-
-        max_positions = strategy_config.get('max_positions', 0)
-        if max_positions <= 0 or max_positions > 20:
-            errors.append(f"最大持仓对数应在1-20之间，当前: {max_positions}")
+        # 验证风险控制参数
+        self._check_rules(strategy_config, self._LIMIT_RULES, errors)
 
         return (len(errors) == 0, errors)
 
+    @staticmethod
+    def _check_rules(config: Dict[str, Any], rules, errors: list[str]):
+        """
+        按规则表检查配置项
+
+        Args:
+            config: 配置字典
+            rules: (配置键, 默认值, 校验函数, 错误模板) 序列
+            errors: 错误消息列表（就地追加）
+        """
+        for key, default, is_valid, template in rules:
+            value = config.get(key, default)
+            if not is_valid(value):
+                errors.append(template.format(v=value, pct=value * 100))
+
     def show_validation_errors(self, errors: list[str]):
         """
         显示验证错误
@@ -236,12 +267,10 @@ class ConfigManager:
         if not errors:
             return
 
-        print("\n" + "="*50)
-        print("配置验证失败")
-        print("="*50 + "\n")
-
-        for i, error in enumerate(errors, 1):
-            print(f"  {i}. {error}")
+        lines = ["", "="*50, "配置验证失败", "="*50 + "\n"]
+        lines.extend(f"  {i}. {error}" for i, error in enumerate(errors, 1))
+        lines.append("\n请修正这些错误后重试\n")
 
-        print("\n请修正这些错误后重试\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
@@ -1,10 +1,12 @@
 """
 币安交易所连接模块 - 使用真实API
 """
-import ccxt.async_support as ccxt
+import ccxt.pro as ccxt
+import aiohttp
+import certifi
 import logging
+import ssl
 from typing import Dict, List, Optional, Any
-from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,8 @@ class BinanceExchange:
         """
         初始化币安交易所连接（只支持合约交易）
 
+        HTTP连接池在 initialize() 中创建，使用前需先调用
+
         Args:
             api_key: API Key
             secret: API Secret
@@ -24,8 +28,12 @@ class BinanceExchange:
         self.api_key = api_key
         self.secret = secret
         self.testnet = testnet
+        self._closed = False
+
+        # 共享HTTP连接池（在 initialize 中创建）
+        self._session: Optional[aiohttp.ClientSession] = None
 
-        # 初始化CCXT异步实例（强制使用合约交易）
+        # 初始化CCXT异步实例（ccxt.pro，兼容REST接口，策略通过它订阅WebSocket行情；强制使用合约交易）
         self.exchange = ccxt.binance({
             'apiKey': api_key,
             'secret': secret,
@@ -43,13 +51,22 @@ class BinanceExchange:
 
         logger.info("币安合约交易连接初始化成功（双向持仓模式）")
 
-    async def close(self):
-        """关闭交易所连接"""
-        try:
-            await self.exchange.close()
-            logger.info("交易所连接已关闭")
-        except Exception as e:
-            logger.error(f"关闭交易所连接失败: {e}")
+    async def initialize(self):
+        """创建共享HTTP连接池（长连接复用TLS会话，缓存DNS解析结果），可重复调用"""
+        if self._session is not None:
+            return
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                ssl=ssl.create_default_context(cafile=certifi.where()),
+            )
+        )
+        # 由本类负责关闭连接池，CCXT关闭时不再处理
+        self.exchange.session = self._session
+        self.exchange.own_session = False
 
     async def test_connection(self) -> bool:
         """测试连接是否正常"""
@@ -200,21 +217,29 @@ class BinanceExchange:
             # 现货交易没有持仓概念，返回对应币种余额
             base_currency = symbol.split('/')[0]
             balance = await self.exchange.fetch_balance()
-            position = {
+            info = balance.get(base_currency, {})
+            return {
                 'symbol': symbol,
-                'amount': balance.get(base_currency, {}).get('total', 0),
-                'free': balance.get(base_currency, {}).get('free', 0),
-                'used': balance.get(base_currency, {}).get('used', 0)
+                'amount': info.get('total', 0),
+                'free': info.get('free', 0),
+                'used': info.get('used', 0)
             }
-            return position
         except Exception as e:
             logger.error(f"获取持仓失败: {e}")
             raise
 
     async def close(self):
-        """关闭连接"""
+        """关闭连接（可重复调用）"""
+        if self._closed:
+            return
+        self._closed = True
+
         try:
             await self.exchange.close()
+            # 外部传入的session不会被CCXT关闭，需要自行关闭（连同其连接池）
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
             logger.info("币安交易所连接已关闭")
         except Exception as e:
             logger.error(f"关闭连接失败: {e}")
@@ -5,13 +5,23 @@ import asyncio
 import sys
 import threading
 from config.config_manager import ConfigManager
-from interactive.config_interactive import ConfigInteractive
+from interactive.config_interactive import ConfigInteractive, read_input
 from exchanges.binance_exchange import BinanceExchange
 from strategies.hedge_grid_strategy import HedgeGridStrategy
 from storage.trade_recorder import TradeRecorder
 from utils.logger import setup_logging, get_logger
 import uvicorn
 
+try:
+    import uvloop  # 可选依赖，基于libuv的事件循环（不支持Windows）
+except ImportError:
+    uvloop = None
+
+# 控制台横幅
+_SEP = "=" * 50
+_BANNER_TITLE = f"\n{_SEP}\n币安双向持仓自动化交易系统\n{_SEP}\n"
+_BANNER_WEB = f"\n{_SEP}\nWeb管理界面已启动\n{_SEP}\n访问地址: http://localhost:8000\n{_SEP}\n"
+
 
 async def run_strategy(strategy):
     """运行策略主循环"""
@@ -31,9 +41,7 @@ async def main():
 
     logger = get_logger(__name__)
 
-    print("\n" + "="*50)
-    print("币安双向持仓自动化交易系统")
-    print("="*50 + "\n")
+    print(_BANNER_TITLE)
 
     # 加载配置
     config_manager = ConfigManager("config/config.json")
@@ -42,7 +50,7 @@ async def main():
     if not config_manager.load():
         print("配置文件不存在，开始配置...\n")
         config_interactive = ConfigInteractive(config_manager)
-        config_interactive.configure()
+        await config_interactive.configure_async()
 
     # 验证配置
     is_valid, errors = config_manager.validate()
@@ -52,7 +60,7 @@ async def main():
         print("请重新配置以修正错误\n")
 
         config_interactive = ConfigInteractive(config_manager)
-        config_interactive.configure()
+        await config_interactive.configure_async()
 
         # 重新验证
         is_valid, errors = config_manager.validate()
@@ -68,8 +76,9 @@ async def main():
     trade_recorder = TradeRecorder("data")
     logger.info("交易记录器已初始化")
 
-    # 确认启动
-    confirm = input("确认启动策略? (y/n): ").strip().lower()
+    # 确认启动（在线程池中等待输入，不阻塞事件循环）
+    loop = asyncio.get_running_loop()
+    confirm = (await loop.run_in_executor(None, read_input, "确认启动策略? (y/n): ")).strip().lower()
     if confirm != 'y':
         print("已取消启动")
         return
@@ -86,7 +95,8 @@ async def main():
         testnet=exchange_config.get('testnet', False)
     )
 
-    # 测试连接
+    # 创建连接池并测试连接
+    await exchange.initialize()
     if not await exchange.test_connection():
         logger.error("币安连接测试失败，请检查API配置")
         return
@@ -115,11 +125,7 @@ async def main():
     strategy_task = asyncio.create_task(run_strategy(strategy))
 
     # 启动Web服务器
-    print("\n" + "="*50)
-    print("Web管理界面已启动")
-    print("="*50)
-    print(f"访问地址: http://localhost:8000")
-    print("="*50 + "\n")
+    print(_BANNER_WEB)
 
     try:
         # 同时运行策略和Web服务器
@@ -133,21 +139,32 @@ async def main():
 
         # 显示交易汇总
         summary = trade_recorder.get_trade_summary()
-        print("\n" + "="*50)
-        print("交易汇总")
-        print("="*50)
-        print(f"总交易次数: {summary['total_trades']}")
-        print(f"买入次数: {summary['buy_trades']}")
-        print(f"卖出次数: {summary['sell_trades']}")
-        print(f"总交易量: {summary['total_volume']:.4f}")
-        print(f"总盈利: {summary['total_profit']:.2f} USDT")
-        print(f"总亏损: {summary['total_loss']:.2f} USDT")
-        print(f"净盈利: {summary['net_profit']:.2f} USDT")
-        print("="*50 + "\n")
+        lines = [
+            "",
+            _SEP,
+            "交易汇总",
+            _SEP,
+            f"总交易次数: {summary['total_trades']}",
+            f"买入次数: {summary['buy_trades']}",
+            f"卖出次数: {summary['sell_trades']}",
+            f"总交易量: {summary['total_volume']:.4f}",
+            f"总盈利: {summary['total_profit']:.2f} USDT",
+            f"总亏损: {summary['total_loss']:.2f} USDT",
+            f"净盈利: {summary['net_profit']:.2f} USDT",
+            _SEP + "\n",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    finally:
+        # 写完待写的交易记录
+        trade_recorder.close()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n程序已退出")
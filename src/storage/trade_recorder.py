@@ -4,12 +4,118 @@
 import json
 import os
 import logging
+import queue
+import threading
 from datetime import datetime
-from typing import Dict, List, Any
-from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Any
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 后台写线程单次合并写入的最大记录数（需小于系统 IOV_MAX）
+_WRITE_BATCH = 256
+
+# 估算的单条交易记录字节数，用于决定尾部读取的起始块大小
+_AVG_LINE_BYTES = 512
+
+
+def _write_all(fd: int, chunks: List[bytes]):
+    """
+    把多段数据一次性写入文件描述符
+
+    支持 os.writev 的平台用分散写一次系统调用写完，
+    否则拼接后写入；出现部分写入时继续写剩余部分
+
+    Args:
+        fd: 文件描述符
+        chunks: 待写入的数据段
+    """
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, chunks)
+        total = sum(len(chunk) for chunk in chunks)
+        if written == total:
+            return
+        rest = memoryview(b''.join(chunks))[written:]
+    else:
+        rest = memoryview(b''.join(chunks))
+
+    while rest:
+        rest = rest[os.write(fd, rest):]
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """序列化为一行紧凑的UTF-8 JSON（含结尾换行符）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """解析一行JSON字节串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _add_to_summary(summary: Dict[str, Any], trade: Dict[str, Any]):
+    """
+    把一条交易计入汇总（原地更新，规则与 compute_summary_from 一致）
+
+    Args:
+        summary: 交易汇总
+        trade: 交易记录
+    """
+    summary['total_trades'] += 1
+    if trade.get('type') == 'buy':
+        summary['buy_trades'] += 1
+    summary['sell_trades'] = summary['total_trades'] - summary['buy_trades']
+    summary['total_volume'] += trade.get('amount', 0)
+    profit = trade.get('profit', 0)
+    if profit > 0:
+        summary['total_profit'] += profit
+    elif profit < 0:
+        summary['total_loss'] -= profit
+    summary['net_profit'] = summary['total_profit'] - summary['total_loss']
+
+
+def _tail_lines(path: str, n: int) -> List[bytes]:
+    """
+    从文件末尾读取最后 n 个非空行
+
+    先按估算行长从末尾读取一块，行数不够时块大小翻倍重读，
+    只有文件很短或行数不足时才会读到文件开头
+
+    Args:
+        path: 文件路径
+        n: 行数
+
+    Returns:
+        按文件顺序排列的最后 n 行（原始字节）
+    """
+    if n <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        block = n * _AVG_LINE_BYTES
+
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            lines = f.read(size - start).splitlines()
+            if start > 0:
+                # 第一行可能被截断
+                lines = lines[1:]
+            lines = [line for line in lines if line.strip()]
+
+            if len(lines) >= n or start == 0:
+                return lines[-n:]
+            block *= 2
+
 
 class TradeRecorder:
     """交易记录器"""
@@ -28,6 +134,16 @@ class TradeRecorder:
         # 确保目录存在
         os.makedirs(data_dir, exist_ok=True)
 
+        # 交易记录由后台线程批量追加写入（首次记录时启动）
+        self._queue = queue.SimpleQueue()
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._flusher = None
+        self._write_lock = threading.Lock()
+
+        # 运行中累计的交易汇总（首次查询时全量扫描一次建立，之后随 record_trade 增量更新）
+        self._agg = None
+
         logger.info(f"交易记录器初始化: {self.data_dir}")
 
     def record_trade(self, trade_data: Dict[str, Any]):
@@ -41,9 +157,20 @@ class TradeRecorder:
             # 添加时间戳
             trade_data['timestamp'] = datetime.now().isoformat()
 
-            # 追加到交易记录文件
-            with open(self.trades_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(trade_data, ensure_ascii=False) + '\n')
+            line = _dumps_line(trade_data)
+
+            # 交给后台线程追加到交易记录文件
+            with self._write_lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="trade-recorder-flusher", daemon=True
+                    )
+                    self._flusher.start()
+                with self._pending_cond:
+                    self._pending += 1
+                self._queue.put(line)
+                if self._agg is not None:
+                    _add_to_summary(self._agg, trade_data)
 
             logger.info(f"交易已记录: {trade_data.get('order_id')}")
 
@@ -62,24 +189,49 @@ class TradeRecorder:
         """
         trades = []
 
-        if not os.path.exists(self.trades_file):
-            return trades
-
         try:
-            with open(self.trades_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # 倒序读取最新的记录
-            for line in reversed(lines[-limit:]):
-                if line.strip():
-                    trade = json.loads(line)
-                    trades.append(trade)
-
+            for trade in self.iter_trades(limit):
+                trades.append(trade)
         except Exception as e:
             logger.error(f"加载交易记录失败: {e}")
 
         return trades
 
+    def iter_trades(self, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        逐条返回最新的交易记录（倒序，最新的在前）
+
+        从文件末尾定位读取，只读入最后 limit 行附近的字节
+
+        Args:
+            limit: 最大返回条数
+
+        Yields:
+            交易记录
+        """
+        self.flush()
+        if not os.path.exists(self.trades_file):
+            return
+
+        for line in reversed(_tail_lines(self.trades_file, limit)):
+            yield _loads(line)
+
+    def _iter_trades(self) -> Iterator[Dict[str, Any]]:
+        """
+        按写入顺序逐行读取全部交易记录（流式，不整体载入内存）
+
+        Yields:
+            交易记录
+        """
+        self.flush()
+        if not os.path.exists(self.trades_file):
+            return
+
+        with open(self.trades_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+
     def save_stats(self, stats: Dict[str, Any]):
         """
         保存统计数据
@@ -90,8 +242,9 @@ class TradeRecorder:
         try:
             stats['last_updated'] = datetime.now().isoformat()
 
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, indent=4, ensure_ascii=False)
+            # 仅供程序读取，使用紧凑格式
+            with open(self.stats_file, 'wb') as f:
+                f.write(_dumps_line(stats))
 
             logger.info("统计数据已保存")
 
@@ -109,8 +262,8 @@ class TradeRecorder:
             return {}
 
         try:
-            with open(self.stats_file, 'r', encoding='utf-8') as f:
-                stats = json.load(f)
+            with open(self.stats_file, 'rb') as f:
+                stats = _loads(f.read())
             logger.info("统计数据已加载")
             return stats
 
@@ -118,9 +271,64 @@ class TradeRecorder:
             logger.error(f"加载统计数据失败: {e}")
             return {}
 
+    def _flush_loop(self):
+        """后台写线程：合并队列中的待写记录，批量追加到交易记录文件"""
+        fd = None
+        stop = False
+        try:
+            while not stop:
+                item = self._queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                while len(batch) < _WRITE_BATCH:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+
+                try:
+                    if fd is None:
+                        fd = os.open(
+                            self.trades_file,
+                            os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0),
+                            0o644
+                        )
+                    _write_all(fd, batch)
+                except OSError as e:
+                    logger.error(f"写入交易记录失败: {e}")
+                finally:
+                    with self._pending_cond:
+                        self._pending -= len(batch)
+                        self._pending_cond.notify_all()
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def flush(self):
+        """等待已提交的交易记录全部写入文件"""
+        with self._pending_cond:
+            self._pending_cond.wait_for(lambda: self._pending == 0)
+
+    def close(self):
+        """写完待写记录并停止后台写线程（可重复调用）"""
+        with self._write_lock:
+            flusher = self._flusher
+            if flusher is None:
+                return
+            self._queue.put(None)
+            flusher.join()
+            self._flusher = None
+
     def clear_trades(self):
         """清空交易记录"""
         try:
+            self.close()
+            self._agg = None
             if os.path.exists(self.trades_file):
                 os.remove(self.trades_file)
                 logger.info("交易记录已清空")
@@ -131,36 +339,53 @@ class TradeRecorder:
         """
         获取交易汇总
 
+        首次调用时扫描一次交易记录文件，之后返回随 record_trade 增量维护的结果
+
+        Returns:
+            交易汇总数据
+        """
+        with self._write_lock:
+            if self._agg is None:
+                try:
+                    self._agg = self.compute_summary_from(self._iter_trades())
+                except Exception as e:
+                    logger.error(f"统计交易汇总失败: {e}")
+                    return self.compute_summary_from(())
+            return dict(self._agg)
+
+    def compute_summary_from(self, trades: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        根据交易记录计算汇总（单次遍历，可直接传入生成器）
+
+        Args:
+            trades: 交易记录列表或迭代器
+
         Returns:
             交易汇总数据
         """
-        trades = self.load_trades(limit=10000)
-
-        if not trades:
-            return {
-                'total_trades': 0,
-                'buy_trades': 0,
-                'sell_trades': 0,
-                'total_volume': 0,
-                'total_profit': 0,
-                'total_loss': 0,
-                'net_profit': 0
-            }
-
-        total_trades = len(trades)
-        buy_trades = sum(1 for t in trades if t.get('type') == 'buy')
-        sell_trades = total_trades - buy_trades
-        total_volume = sum(t.get('amount', 0) for t in trades)
-        total_profit = sum(t.get('profit', 0) for t in trades if t.get('profit', 0) > 0)
-        total_loss = sum(abs(t.get('profit', 0)) for t in trades if t.get('profit', 0) < 0)
-        net_profit = sum(t.get('profit', 0) for t in trades)
+        total_trades = 0
+        buy_trades = 0
+        total_volume = 0
+        total_profit = 0
+        total_loss = 0
+
+        for t in trades:
+            total_trades += 1
+            if t.get('type') == 'buy':
+                buy_trades += 1
+            total_volume += t.get('amount', 0)
+            profit = t.get('profit', 0)
+            if profit > 0:
+                total_profit += profit
+            elif profit < 0:
+                total_loss -= profit
 
         return {
             'total_trades': total_trades,
             'buy_trades': buy_trades,
-            'sell_trades': sell_trades,
+            'sell_trades': total_trades - buy_trades,
             'total_volume': total_volume,
             'total_profit': total_profit,
             'total_loss': total_loss,
-            'net_profit': net_profit
+            'net_profit': total_profit - total_loss
         }
@@ -3,12 +3,28 @@
 """
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any
-from decimal import Decimal
 import ccxt
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# 行情推送超过该时间（秒）未更新则视为中断，改用REST查询
+_STREAM_STALE_SEC = 10
+
+# 下单参数（所有订单共用，ccxt 只读取不修改 params）
+_OPEN_LONG_PARAMS = {'positionSide': 'LONG'}
+_OPEN_SHORT_PARAMS = {'positionSide': 'SHORT'}
+_CLOSE_LONG_PARAMS = {'positionSide': 'LONG', 'reduceOnly': True}
+_CLOSE_SHORT_PARAMS = {'positionSide': 'SHORT', 'reduceOnly': True}
+
+# 持仓方向 -> (盈亏符号, 名称, 平仓参数)
+_SIDES = {
+    'long': (1, '多单', _CLOSE_LONG_PARAMS),
+    'short': (-1, '空单', _CLOSE_SHORT_PARAMS),
+}
+
 
 class HedgeGridStrategy:
     """双向持仓策略（同时持有多单和空单）"""
@@ -35,57 +51,90 @@ class HedgeGridStrategy:
         self.trade_recorder = trade_recorder
 
         # 策略参数
-        self.investment = Decimal(str(config.get('investment', 1000)))  # 投资金额（每个单方向）
-        self.position_ratio = Decimal(str(config.get('position_ratio', 0.1)))  # 仓位比例（0-1，如0.1表示10%）
+        self.investment = float(config.get('investment', 1000))  # 投资金额（每个单方向）
+        self.position_ratio = float(config.get('position_ratio', 0.1))  # 仓位比例（0-1，如0.1表示10%）
         self.leverage = config.get('leverage', 5)  # 杠杆倍数
 
         # 触发阈值（支持ATR或百分比）
         self.up_threshold_type = config.get('up_threshold_type', 'percent')  # 'percent' 或 'atr'
-        self.up_threshold = Decimal(str(config.get('up_threshold', 0.02)))  # 上涨触发阈值
-        self.up_atr_multiplier = Decimal(str(config.get('up_atr_multiplier', 0.9)))  # 上涨ATR倍数
+        self.up_threshold = float(config.get('up_threshold', 0.02))  # 上涨触发阈值
+        self.up_atr_multiplier = float(config.get('up_atr_multiplier', 0.9))  # 上涨ATR倍数
 
         self.down_threshold_type = config.get('down_threshold_type', 'percent')  # 'percent' 或 'atr'
-        self.down_threshold = Decimal(str(config.get('down_threshold', 0.02)))  # 下跌触发阈值
-        self.down_atr_multiplier = Decimal(str(config.get('down_atr_multiplier', 0.9)))  # 下跌ATR倍数
+        self.down_threshold = float(config.get('down_threshold', 0.02))  # 下跌触发阈值
+        self.down_atr_multiplier = float(config.get('down_atr_multiplier', 0.9))  # 下跌ATR倍数
 
         # 止损参数（支持ATR或百分比）
         self.stop_loss_type = config.get('stop_loss_type', 'percent')  # 'percent' 或 'atr'
-        self.stop_loss_ratio = Decimal(str(config.get('stop_loss_ratio', 0.05)))  # 止损比例
-        self.stop_loss_atr_multiplier = Decimal(str(config.get('stop_loss_atr_multiplier', 1.5)))  # 止损ATR倍数
+        self.stop_loss_ratio = float(config.get('stop_loss_ratio', 0.05))  # 止损比例
+        self.stop_loss_atr_multiplier = float(config.get('stop_loss_atr_multiplier', 1.5))  # 止损ATR倍数
+        self._recompute_constants()
 
         # ATR参数
         self.atr_period = config.get('atr_period', 14)  # ATR周期（默认14）
         self.atr_timeframe = config.get('atr_timeframe', '1h')  # ATR时间周期（默认1小时）
+        self._timeframe_ms = ccxt.Exchange.parse_timeframe(self.atr_timeframe) * 1000  # K线周期（毫秒）
+        self._last_bar_ts = None  # 最近一根已计入ATR的收盘K线时间戳
+        self._prev_close = None  # 该K线的收盘价
+        self._next_atr_refresh_ms = 0  # 下一根K线收盘时间，到时才刷新ATR
 
         # 风险控制参数
-        self.max_daily_loss = Decimal(str(config.get('max_daily_loss', 100)))  # 每日最大亏损USDT
+        self.max_daily_loss = float(config.get('max_daily_loss', 100))  # 每日最大亏损USDT
         self.max_daily_trades = config.get('max_daily_trades', 50)  # 每日最大交易次数
         self.max_positions = config.get('max_positions', 5)  # 最大持仓对数
 
         # 持仓管理
-        self.long_positions: List[Dict] = []  # 多单列表
-        self.short_positions: List[Dict] = []  # 空单列表
+        self.long_positions: Dict[str, Dict] = {}  # 未平仓多单（按订单ID索引，平仓时移除）
+        self.short_positions: Dict[str, Dict] = {}  # 未平仓空单（按订单ID索引，平仓时移除）
 
         # 风险控制状态
-        self.daily_loss = Decimal('0')  # 每日亏损
+        self.daily_loss = 0.0  # 每日亏损
         self.daily_trades = 0  # 每日交易次数
         self.is_paused = False  # 是否暂停交易
 
         # 运行状态
         self.is_running = False
-        self.current_atr = Decimal('0')  # 当前ATR值
-        self.account_balance = Decimal('0')  # 账户余额
+        self.current_atr = 0.0  # 当前ATR值
+        self.account_balance = 0.0  # 账户余额
+        self._threshold_desc: Dict[str, str] = {}  # 阈值描述（ATR变化时重新生成）
+        self._render_threshold_desc()
 
         # 统计数据
-        self.total_profit = Decimal('0')
-        self.total_loss = Decimal('0')
+        self.total_profit = 0.0
+        self.total_loss = 0.0
         self.trade_count = 0
         self.long_profit_count = 0
         self.long_loss_count = 0
         self.short_profit_count = 0
         self.short_loss_count = 0
 
-        logger.info(f"双向持仓策略初始化: {symbol}")
+        # 行情缓存（同一轮内多处取价时复用）
+        self._last_price = 0.0
+        self._last_ticker_ts = 0.0
+
+        # WebSocket行情推送（交易所支持 watchTicker 时启用，推送正常时不再走REST查询）
+        self._price_task: Optional[asyncio.Task] = None
+        self._price_streaming = False
+        self._last_push_ts = 0.0  # 最近一次收到推送的时间（只由推送更新）
+        self._price_event = asyncio.Event()  # 每次收到推送时置位，唤醒主循环
+
+        # Web广播函数（首次使用时解析，None表示尚未解析，False表示不可用）
+        self._broadcast = None
+
+        # 持仓变化事件（开平仓时置位，由状态广播任务合并后推送到Web界面）
+        self._state_changed = asyncio.Event()
+        self._status_task: Optional[asyncio.Task] = None
+
+        logger.info("双向持仓策略初始化: %s", symbol)
+
+    def _recompute_constants(self):
+        """根据当前参数预先计算止盈止损乘数和手续费率（修改阈值参数后需重新调用）"""
+        self._long_tp_mul = 1 + self.up_threshold
+        self._long_sl_mul = 1 - self.stop_loss_ratio
+        self._short_tp_mul = 1 - self.down_threshold
+        self._short_sl_mul = 1 + self.stop_loss_ratio
+        # 开仓+平仓手续费率，使用Taker费率0.04%作为保守估计
+        self._fee_rate_round_trip = 0.0004 * 2
 
     async def initialize(self):
         """初始化策略"""
@@ -93,26 +142,26 @@ class HedgeGridStrategy:
 
         # 检查仓位比例和杠杆倍数
         if self.position_ratio <= 0 or self.position_ratio > 1:
-            raise ValueError(f"仓位比例必须在0-100%之间，当前: {self.position_ratio*100}%")
+            raise ValueError(f"仓位比例必须在0-100%之间，当前: {self.position_ratio*100:g}%")
 
         if self.leverage < 1 or self.leverage > 125:
             raise ValueError(f"杠杆倍数必须在1-125之间，当前: {self.leverage}")
 
-        # 获取账户余额
-        await self._fetch_account_balance()
-
-        # 计算ATR
-        await self._update_atr()
-        logger.info(f"当前ATR({self.atr_timeframe}, {self.atr_period}周期): {self.current_atr}")
+        # 获取账户余额和计算ATR互不依赖，同时进行
+        await asyncio.gather(
+            self._fetch_account_balance(),
+            self._refresh_atr_if_due()
+        )
+        logger.info("当前ATR(%s, %s周期): %s", self.atr_timeframe, self.atr_period, self.current_atr)
 
         # 显示止盈止损配置
-        logger.info(f"上涨触发: {self._get_threshold_desc('up')}")
-        logger.info(f"下跌触发: {self._get_threshold_desc('down')}")
-        logger.info(f"止损配置: {self._get_threshold_desc('stop_loss')}")
+        logger.info("上涨触发: %s", self._get_threshold_desc('up'))
+        logger.info("下跌触发: %s", self._get_threshold_desc('down'))
+        logger.info("止损配置: %s", self._get_threshold_desc('stop_loss'))
 
-        logger.info(f"账户余额: {self.account_balance} USDT")
-        logger.info(f"仓位比例: {self.position_ratio*100}%")
-        logger.info(f"杠杆倍数: {self.leverage}x")
+        logger.info("账户余额: %s USDT", self.account_balance)
+        logger.info("仓位比例: %g%%", self.position_ratio*100)
+        logger.info("杠杆倍数: %sx", self.leverage)
 
         logger.info("双向持仓策略初始化完成")
 
@@ -130,20 +179,20 @@ class HedgeGridStrategy:
             if self.up_threshold_type == 'atr':
                 return f"ATR × {self.up_atr_multiplier} (约 {self.current_atr * self.up_atr_multiplier:.2f})"
             else:
-                return f"{self.up_threshold * 100}%"
+                return f"{self.up_threshold * 100:g}%"
         elif threshold_type == 'down':
             if self.down_threshold_type == 'atr':
                 return f"ATR × {self.down_atr_multiplier} (约 {self.current_atr * self.down_atr_multiplier:.2f})"
             else:
-                return f"{self.down_threshold * 100}%"
+                return f"{self.down_threshold * 100:g}%"
         elif threshold_type == 'stop_loss':
             if self.stop_loss_type == 'atr':
                 return f"ATR × {self.stop_loss_atr_multiplier} (约 {self.current_atr * self.stop_loss_atr_multiplier:.2f})"
             else:
-                return f"{self.stop_loss_ratio * 100}%"
+                return f"{self.stop_loss_ratio * 100:g}%"
         return "未知"
 
-    async def _fetch_account_balance(self) -> Decimal:
+    async def _fetch_account_balance(self) -> float:
         """
         获取账户USDT余额
 
@@ -155,30 +204,30 @@ class HedgeGridStrategy:
 
             # 尝试获取USDT余额
             # 合约账户可能有不同的余额结构
-            usdt_balance = Decimal('0')
+            usdt_balance = 0.0
 
             # 尝试直接获取
             if 'USDT' in balance:
-                usdt_balance = Decimal(str(balance['USDT'].get('free', 0)))
+                usdt_balance = float(balance['USDT'].get('free') or 0)
 
             # 如果是合约账户，尝试获取总权益
             elif 'USDT' not in balance and 'info' in balance:
                 # 合约账户通常在 info 字段中
                 total_balance = balance.get('USDT', {}).get('total', 0)
-                usdt_balance = Decimal(str(total_balance))
+                usdt_balance = float(total_balance or 0)
 
             # 如果余额为0，尝试从账户总余额获取
             if usdt_balance == 0 and 'USDT' in balance:
-                usdt_balance = Decimal(str(balance['USDT'].get('total', 0)))
+                usdt_balance = float(balance['USDT'].get('total') or 0)
 
             self.account_balance = usdt_balance
-            logger.info(f"账户余额查询成功: {usdt_balance} USDT")
+            logger.info("账户余额查询成功: %s USDT", usdt_balance)
             return usdt_balance
         except Exception as e:
-            logger.error(f"获取账户余额失败: {e}")
+            logger.error("获取账户余额失败: %s", e)
             raise
 
-    def _calculate_position_amount(self, current_price: Decimal) -> Decimal:
+    def _calculate_position_amount(self, current_price: float) -> float:
         """
         根据账户余额、仓位比例和杠杆倍数计算开仓数量
 
@@ -199,52 +248,174 @@ class HedgeGridStrategy:
         # 开仓数量 = 开仓金额 / 当前价格
         position_amount = position_amount_usdt / current_price
 
-        logger.info(f"开仓数量计算: 账户余额={self.account_balance}, 仓位比例={self.position_ratio*100}%, 杠杆={self.leverage}x, 当前价格={current_price}")
-        logger.info(f"计算结果: 可用金额={available_amount:.2f}, 开仓金额={position_amount_usdt:.2f}, 开仓数量={position_amount:.6f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("开仓数量计算: 账户余额=%s, 仓位比例=%g%%, 杠杆=%sx, 当前价格=%s", self.account_balance, self.position_ratio*100, self.leverage, current_price)
+            logger.info("计算结果: 可用金额=%.2f, 开仓金额=%.2f, 开仓数量=%.6f", available_amount, position_amount_usdt, position_amount)
 
         return position_amount
 
     async def _update_atr(self):
-        """计算并更新ATR值"""
+        """
+        计算并更新ATR值（Wilder平滑）
+
+        首次调用时取最近 atr_period 根已收盘K线的TR均值作为初值；
+        之后只拉取最近2根K线，出现新的已收盘K线时按
+        ATR = (ATR × (n-1) + TR) / n 递推，没有新K线则直接返回
+        """
         try:
-            # 获取K线数据
+            if self._last_bar_ts is not None:
+                ohlcv = await self.exchange.fetch_ohlcv(
+                    self.symbol,
+                    timeframe=self.atr_timeframe,
+                    limit=2
+                )
+                # 最后一根是尚未收盘的K线
+                closed = ohlcv[:-1]
+                if not closed or closed[-1][0] == self._last_bar_ts:
+                    return
+
+                bar = closed[-1]
+                if bar[0] - self._last_bar_ts == self._timeframe_ms:
+                    high, low, close = bar[2], bar[3], bar[4]
+                    prev_close = self._prev_close
+
+                    # TR = max(H-L, |H-PC|, |L-PC|)
+                    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+                    n = self.atr_period
+                    self._set_atr((self.current_atr * (n - 1) + tr) / n)
+
+                    self._last_bar_ts = bar[0]
+                    self._prev_close = close
+                    logger.info("ATR更新成功: %.8f", self.current_atr)
+                    return
+                # 中间有K线缺失，重新全量计算
+
+            # 获取K线数据（多取一根未收盘K线）
             ohlcv = await self.exchange.fetch_ohlcv(
                 self.symbol,
                 timeframe=self.atr_timeframe,
-                limit=self.atr_period + 1
+                limit=self.atr_period + 2
             )
-
-            # 计算True Range
-            tr_list = []
-            prev_close = None
-
-            for candle in ohlcv:
-                timestamp, open_price, high, low, close, volume = candle
-                high = Decimal(str(high))
-                low = Decimal(str(low))
-                close = Decimal(str(close))
-
-                if prev_close is not None:
-                    # TR = max(H-L, |H-PC|, |L-PC|)
-                    tr1 = high - low
-                    tr2 = abs(high - prev_close)
-                    tr3 = abs(low - prev_close)
-                    tr = max(tr1, tr2, tr3)
-                    tr_list.append(tr)
-
-                prev_close = close
-
-            # 计算ATR（简单移动平均）
-            if tr_list:
-                self.current_atr = sum(tr_list) / len(tr_list)
-                logger.info(f"ATR更新成功: {self.current_atr:.8f}")
+            closed = ohlcv[:-1]
+
+            # 计算ATR初值（True Range 的简单移动平均，整列向量化计算）
+            if len(closed) >= 2:
+                arr = np.asarray(closed, dtype=np.float64)
+                high = arr[1:, 2]
+                low = arr[1:, 3]
+                prev_close = arr[:-1, 4]
+
+                # TR = max(H-L, |H-PC|, |L-PC|)
+                tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+                self._set_atr(float(tr.mean()))
+                self._last_bar_ts = closed[-1][0]
+                self._prev_close = closed[-1][4]
+                logger.info("ATR更新成功: %.8f", self.current_atr)
             else:
                 logger.warning("ATR计算失败，使用默认值")
-                self.current_atr = Decimal('0')
+                self._set_atr(0.0)
+                self._last_bar_ts = None
 
         except Exception as e:
-            logger.error(f"计算ATR失败: {e}")
-            self.current_atr = Decimal('0')
+            logger.error("计算ATR失败: %s", e)
+            self._set_atr(0.0)
+            self._last_bar_ts = None
+
+    async def _refresh_atr_if_due(self):
+        """在下一根K线收盘后才调用 _update_atr，其余时间直接返回"""
+        if time.time() * 1000 < self._next_atr_refresh_ms:
+            return
+
+        await self._update_atr()
+
+        # 已计入的最后一根K线之后那根K线的收盘时间；交易所尚未给出新K线时该时间已过，下次检查会重试
+        if self._last_bar_ts is not None:
+            self._next_atr_refresh_ms = self._last_bar_ts + 2 * self._timeframe_ms
+
+    def _set_atr(self, atr: float):
+        """
+        更新ATR值并重新生成阈值描述
+
+        Args:
+            atr: 新的ATR值
+        """
+        self.current_atr = atr
+        self._render_threshold_desc()
+
+    def _render_threshold_desc(self):
+        """预先生成 get_status 使用的阈值描述，避免每次查询都重新格式化"""
+        self._threshold_desc = {
+            'up_threshold': self._get_threshold_desc('up'),
+            'down_threshold': self._get_threshold_desc('down'),
+            'stop_loss': self._get_threshold_desc('stop_loss')
+        }
+
+    async def get_price(self) -> float:
+        """
+        获取当前价格（优先使用行情推送，其次短时缓存）
+
+        Returns:
+            当前价格
+        """
+        return await self._get_price()
+
+    async def _get_price(self, max_age_ms: int = 500) -> float:
+        """
+        获取当前价格，缓存未过期时直接返回缓存值
+
+        Args:
+            max_age_ms: 缓存有效期（毫秒）
+
+        Returns:
+            当前价格
+        """
+        now = time.monotonic()
+        # 推送正常时直接使用最新推送价格
+        if self._stream_fresh(now):
+            return self._last_price
+
+        if self._last_ticker_ts and (now - self._last_ticker_ts) * 1000 < max_age_ms:
+            return self._last_price
+
+        ticker = await self.exchange.fetch_ticker(self.symbol)
+        self._last_price = float(ticker['last'])
+        self._last_ticker_ts = time.monotonic()
+        return self._last_price
+
+    def _stream_fresh(self, now: float) -> bool:
+        """
+        行情推送是否正常（已订阅且最近一次推送未超过 _STREAM_STALE_SEC）
+
+        Args:
+            now: 当前 time.monotonic() 时间
+
+        Returns:
+            推送价格可直接使用时返回True
+        """
+        return self._price_streaming and now - self._last_push_ts < _STREAM_STALE_SEC
+
+    def _invalidate_price(self):
+        """成交后作废REST价格缓存，下次取价重新查询（推送正常时由推送保持最新）"""
+        if not self._stream_fresh(time.monotonic()):
+            self._last_ticker_ts = 0.0
+
+    async def _watch_price(self):
+        """持续接收行情推送并更新价格缓存，断线期间 _get_price 回退到REST查询"""
+        while self.is_running:
+            try:
+                ticker = await self.exchange.watch_ticker(self.symbol)
+                self._last_price = float(ticker['last'])
+                self._last_ticker_ts = self._last_push_ts = time.monotonic()
+                self._price_streaming = True
+                self._price_event.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._price_streaming = False
+                logger.error("行情推送异常: %s", e)
+                await asyncio.sleep(1)
+
+        self._price_streaming = False
 
     async def open_initial_positions(self):
         """开启初始多空单"""
@@ -254,19 +425,18 @@ class HedgeGridStrategy:
         await self.cancel_all_orders()
 
         # 获取当前价格
-        ticker = await self.exchange.fetch_ticker(self.symbol)
-        current_price = Decimal(str(ticker['last']))
-        logger.info(f"当前价格: {current_price}")
-
-        # 开一个多单
-        await self._open_long_position(current_price)
+        current_price = await self._get_price()
+        logger.info("当前价格: %s", current_price)
 
-        # 开一个空单
-        await self._open_short_position(current_price)
+        # 同时开一个多单和一个空单
+        await asyncio.gather(
+            self._open_long_position(current_price),
+            self._open_short_position(current_price)
+        )
 
-        logger.info(f"初始多空单开启完成: 多单 {len(self.long_positions)} 个, 空单 {len(self.short_positions)} 个")
+        logger.info("初始多空单开启完成: 多单 %s 个, 空单 %s 个", len(self.long_positions), len(self.short_positions))
 
-    async def _open_long_position(self, price: Decimal):
+    async def _open_long_position(self, price: float):
         """
         开多单（U本位合约）
 
@@ -275,33 +445,37 @@ class HedgeGridStrategy:
         """
         try:
             # 计算开仓数量（基于账户余额、仓位比例和杠杆倍数）
+            price = float(price)
             position_amount = self._calculate_position_amount(price)
 
             # U本位合约，使用 positionSide: 'LONG' 指定多单
-            amount = float(position_amount)
+            # 按交易对数量精度取整一次，持仓记录的就是实际下单数量
+            amount = float(self.exchange.amount_to_precision(self.symbol, position_amount))
             order = await self.exchange.create_market_buy_order(
                 self.symbol,
                 amount,
-                params={'positionSide': 'LONG'}
+                params=_OPEN_LONG_PARAMS
             )
+            self._invalidate_price()
 
             # 记录多单信息
             long_position = {
                 'order_id': order['id'],
-                'entry_price': Decimal(str(order.get('average', order.get('price', price)))),
-                'amount': position_amount,
+                'entry_price': float(order.get('average') or order.get('price') or price),
+                'amount': amount,
                 'entry_time': order['timestamp'],
                 'is_open': True,
                 'entry_atr': self.current_atr  # 记录开仓时的ATR
             }
-            self.long_positions.append(long_position)
+            self.long_positions[long_position['order_id']] = long_position
+            self._state_changed.set()
 
-            logger.info(f"开多单成功: 价格 {long_position['entry_price']}, 数量 {long_position['amount']:.6f}")
+            logger.info("开多单成功: 价格 %s, 数量 %.6f", long_position['entry_price'], long_position['amount'])
 
         except Exception as e:
-            logger.error(f"开多单失败: {e}")
+            logger.error("开多单失败: %s", e)
 
-    async def _open_short_position(self, price: Decimal):
+    async def _open_short_position(self, price: float):
         """
         开空单（U本位合约）
 
@@ -310,33 +484,37 @@ class HedgeGridStrategy:
         """
         try:
             # 计算开仓数量（基于账户余额、仓位比例和杠杆倍数）
+            price = float(price)
             position_amount = self._calculate_position_amount(price)
 
             # U本位合约，做空不需要持有币种，使用 positionSide: 'SHORT' 指定空单
-            amount = float(position_amount)
+            # 按交易对数量精度取整一次，持仓记录的就是实际下单数量
+            amount = float(self.exchange.amount_to_precision(self.symbol, position_amount))
             order = await self.exchange.create_market_sell_order(
                 self.symbol,
                 amount,
-                params={'positionSide': 'SHORT'}
+                params=_OPEN_SHORT_PARAMS
             )
+            self._invalidate_price()
 
             # 记录空单信息
             short_position = {
                 'order_id': order['id'],
-                'entry_price': Decimal(str(order.get('average', order.get('price', price)))),
-                'amount': position_amount,
+                'entry_price': float(order.get('average') or order.get('price') or price),
+                'amount': amount,
                 'entry_time': order['timestamp'],
                 'is_open': True,
                 'entry_atr': self.current_atr  # 记录开仓时的ATR
             }
-            self.short_positions.append(short_position)
+            self.short_positions[short_position['order_id']] = short_position
+            self._state_changed.set()
 
-            logger.info(f"开空单成功: 价格 {short_position['entry_price']}, 数量 {short_position['amount']:.6f}")
+            logger.info("开空单成功: 价格 %s, 数量 %.6f", short_position['entry_price'], short_position['amount'])
 
         except Exception as e:
-            logger.error(f"开空单失败: {e}")
+            logger.error("开空单失败: %s", e)
 
-    def _calculate_long_stop_loss(self, position: Dict) -> Decimal:
+    def _calculate_long_stop_loss(self, position: Dict) -> float:
         """
         计算多单止损价格
 
@@ -354,11 +532,11 @@ class HedgeGridStrategy:
             stop_price = entry_price - (entry_atr * self.stop_loss_atr_multiplier)
         else:
             # 基于百分比计算止损
-            stop_price = entry_price * (1 - self.stop_loss_ratio)
+            stop_price = entry_price * self._long_sl_mul
 
         return stop_price
 
-    def _calculate_long_take_profit(self, position: Dict) -> Decimal:
+    def _calculate_long_take_profit(self, position: Dict) -> float:
         """
         计算多单止盈价格
 
@@ -376,11 +554,11 @@ class HedgeGridStrategy:
             tp_price = entry_price + (entry_atr * self.up_atr_multiplier)
         else:
             # 基于百分比计算止盈
-            tp_price = entry_price * (1 + self.up_threshold)
+            tp_price = entry_price * self._long_tp_mul
 
         return tp_price
 
-    def _calculate_short_stop_loss(self, position: Dict) -> Decimal:
+    def _calculate_short_stop_loss(self, position: Dict) -> float:
         """
         计算空单止损价格
 
@@ -398,11 +576,11 @@ class HedgeGridStrategy:
             stop_price = entry_price + (entry_atr * self.stop_loss_atr_multiplier)
         else:
             # 基于百分比计算止损
-            stop_price = entry_price * (1 + self.stop_loss_ratio)
+            stop_price = entry_price * self._short_sl_mul
 
         return stop_price
 
-    def _calculate_short_take_profit(self, position: Dict) -> Decimal:
+    def _calculate_short_take_profit(self, position: Dict) -> float:
         """
         计算空单止盈价格
 
@@ -420,33 +598,43 @@ class HedgeGridStrategy:
             tp_price = entry_price - (entry_atr * self.down_atr_multiplier)
         else:
             # 基于百分比计算止盈
-            tp_price = entry_price * (1 - self.down_threshold)
+            tp_price = entry_price * self._short_tp_mul
 
         return tp_price
 
-    async def check_long_triggers(self, current_price: Decimal):
+    async def check_long_triggers(self, current_price: float):
         """
         检查多单触发条件
 
         Args:
             current_price: 当前价格
         """
-        for position in list(self.long_positions):
+        current_price = float(current_price)
+
+        # 循环外取出阈值参数，避免每个持仓重复查找属性
+        tp_use_atr = self.up_threshold_type == 'atr'
+        sl_use_atr = self.stop_loss_type == 'atr'
+        tp_atr_mul = self.up_atr_multiplier
+        sl_atr_mul = self.stop_loss_atr_multiplier
+        tp_mul = self._long_tp_mul
+        sl_mul = self._long_sl_mul
+        current_atr = self.current_atr
+
+        for position in list(self.long_positions.values()):
             if not position['is_open']:
                 continue
 
             entry_price = position['entry_price']
+            entry_atr = position.get('entry_atr', current_atr)
 
-            # 计算止盈价格
-            tp_price = self._calculate_long_take_profit(position)
-
-            # 计算止损价格
-            sl_price = self._calculate_long_stop_loss(position)
+            # 计算止盈止损价格（与 _calculate_long_take_profit / _calculate_long_stop_loss 相同）
+            tp_price = entry_price + (entry_atr * tp_atr_mul) if tp_use_atr else entry_price * tp_mul
+            sl_price = entry_price - (entry_atr * sl_atr_mul) if sl_use_atr else entry_price * sl_mul
 
             # 检查止盈
             if current_price >= tp_price:
-                logger.info(f"多单止盈触发: 当前价格 {current_price} >= 止盈价格 {tp_price}")
-                await self._close_long_position(position, current_price, reason="止盈")
+                logger.info("多单止盈触发: 当前价格 %s >= 止盈价格 %s", current_price, tp_price)
+                await self._close_position(position, current_price, 'long', reason="止盈")
 
                 # 风险控制检查后重新开多单
                 if self._check_risk_control_full():
@@ -457,8 +645,8 @@ class HedgeGridStrategy:
 
             # 检查止损
             if current_price <= sl_price:
-                logger.info(f"多单止损触发: 当前价格 {current_price} <= 止损价格 {sl_price}")
-                await self._close_long_position(position, current_price, reason="止损")
+                logger.info("多单止损触发: 当前价格 %s <= 止损价格 %s", current_price, sl_price)
+                await self._close_position(position, current_price, 'long', reason="止损")
 
                 # 风险控制检查后重新开多单
                 if self._check_risk_control_full():
@@ -467,29 +655,39 @@ class HedgeGridStrategy:
                     logger.warning("风险控制触发，跳过重新开多单")
                 continue
 
-    async def check_short_triggers(self, current_price: Decimal):
+    async def check_short_triggers(self, current_price: float):
         """
         检查空单触发条件
 
         Args:
             current_price: 当前价格
         """
-        for position in list(self.short_positions):
+        current_price = float(current_price)
+
+        # 循环外取出阈值参数，避免每个持仓重复查找属性
+        tp_use_atr = self.down_threshold_type == 'atr'
+        sl_use_atr = self.stop_loss_type == 'atr'
+        tp_atr_mul = self.down_atr_multiplier
+        sl_atr_mul = self.stop_loss_atr_multiplier
+        tp_mul = self._short_tp_mul
+        sl_mul = self._short_sl_mul
+        current_atr = self.current_atr
+
+        for position in list(self.short_positions.values()):
             if not position['is_open']:
                 continue
 
             entry_price = position['entry_price']
+            entry_atr = position.get('entry_atr', current_atr)
 
-            # 计算止盈价格（空单是价格下跌止盈）
-            tp_price = self._calculate_short_take_profit(position)
-
-            # 计算止损价格（空单是价格上涨止损）
-            sl_price = self._calculate_short_stop_loss(position)
+            # 计算止盈止损价格（空单是价格下跌止盈、上涨止损，与 _calculate_short_* 相同）
+            tp_price = entry_price - (entry_atr * tp_atr_mul) if tp_use_atr else entry_price * tp_mul
+            sl_price = entry_price + (entry_atr * sl_atr_mul) if sl_use_atr else entry_price * sl_mul
 
             # 检查止盈（价格下跌）
             if current_price <= tp_price:
-                logger.info(f"空单止盈触发: 当前价格 {current_price} <= 止盈价格 {tp_price}")
-                await self._close_short_position(position, current_price, reason="止盈")
+                logger.info("空单止盈触发: 当前价格 %s <= 止盈价格 %s", current_price, tp_price)
+                await self._close_position(position, current_price, 'short', reason="止盈")
 
                 # 风险控制检查后重新开空单
                 if self._check_risk_control_full():
@@ -500,8 +698,8 @@ class HedgeGridStrategy:
 
             # 检查止损（价格上涨）
             if current_price >= sl_price:
-                logger.info(f"空单止损触发: 当前价格 {current_price} >= 止损价格 {sl_price}")
-                await self._close_short_position(position, current_price, reason="止损")
+                logger.info("空单止损触发: 当前价格 %s >= 止损价格 %s", current_price, sl_price)
+                await self._close_position(position, current_price, 'short', reason="止损")
 
                 # 风险控制检查后重新开空单
                 if self._check_risk_control_full():
@@ -510,129 +708,50 @@ class HedgeGridStrategy:
                     logger.warning("风险控制触发，跳过重新开空单")
                 continue
 
-    async def _close_long_position(self, position: Dict, current_price: Decimal, reason: str = ""):
+    async def _close_position(self, position: Dict, current_price: float, side: str, reason: str = ""):
         """
-        平多单（U本位合约）
+        平仓（U本位合约，多单和空单共用）
 
         Args:
-            position: 多单信息
+            position: 持仓信息
             current_price: 当前价格
+            side: 持仓方向，'long' 或 'short'
             reason: 平仓原因
         """
-        try:
-            position['is_open'] = False
-            amount = float(position['amount'])
-
-            # U本位合约，平多单使用 positionSide: 'LONG'
-            order = await self.exchange.create_market_sell_order(
-                self.symbol,
-                amount,
-                params={'positionSide': 'LONG', 'reduceOnly': True}
-            )
-
-            # 计算盈亏
-            entry_price = position['entry_price']
-            profit_amount = (current_price - entry_price) * position['amount']
-            profit_ratio = (current_price - entry_price) / entry_price
-
-            # 计算交易手续费（开仓+平仓，使用Taker费率0.04%作为保守估计）
-            fee_rate = Decimal('0.0004')  # 0.04%
-            position_value_usdt = position['amount'] * current_price
-            total_fee_usdt = position_value_usdt * fee_rate * 2  # 开仓和平仓各一次
-
-            # 计算净盈亏（扣除手续费）
-            profit_amount_net = profit_amount - total_fee_usdt
-            profit_ratio_net = (current_price - entry_price) / entry_price - (total_fee_usdt / position_value_usdt)
-
-            # 更新统计
-            self.trade_count += 1
-            self.daily_trades += 1
-
-            if profit_amount >= 0:
-                self.total_profit += profit_amount_net
-                self.long_profit_count += 1
-                logger.info(
-                    f"多单止盈: 入场 {entry_price}, 平仓 {current_price} | "
-                    f"毛利润 {profit_amount:.4f} USDT ({profit_ratio*100:.2f}%) | "
-                    f"手续费 {total_fee_usdt:.4f} USDT | "
-                    f"净利润 {profit_amount_net:.4f} USDT ({profit_ratio_net*100:.2f}%)"
-                )
-            else:
-                self.total_loss += abs(profit_amount_net)
-                self.long_loss_count += 1
-                self.update_daily_stats(abs(profit_amount_net))
-                logger.warning(
-                    f"多单止损: 入场 {entry_price}, 平仓 {current_price} | "
-                    f"毛亏损 {abs(profit_amount):.4f} USDT ({profit_ratio*100:.2f}%) | "
-                    f"手续费 {total_fee_usdt:.4f} USDT | "
-                    f"净亏损 {abs(profit_amount_net):.4f} USDT ({profit_ratio_net*100:.2f}%)"
-                )
-
-            # 记录交易
-            if self.trade_recorder:
-                trade_data = {
-                    'symbol': self.symbol,
-                    'order_id': position['order_id'],
-                    'close_order_id': order.get('id'),
-                    'type': 'long',
-                    'entry_price': float(entry_price),
-                    'exit_price': float(current_price),
-                    'amount': float(position['amount']),
-                    'profit': float(profit_amount_net),  # 使用净利润
-                    'profit_ratio': float(profit_ratio_net),  # 使用净利率
-                    'reason': reason,
-                    'timestamp': order.get('timestamp')
-                }
-                self.trade_recorder.record_trade(trade_data)
-
-                # 广播交易更新到Web界面
-                try:
-                    from web.app import broadcast_trade_update
-                    await broadcast_trade_update(trade_data)
-                except Exception as e:
-                    # Web模块可能未初始化，忽略错误
-                    pass
-
-            # 从持仓中移除
-            if position in self.long_positions:
-                self.long_positions.remove(position)
+        sign, name, close_params = _SIDES[side]
 
-        except Exception as e:
-            logger.error(f"平多单失败: {e}")
-
-    async def _close_short_position(self, position: Dict, current_price: Decimal, reason: str = ""):
-        """
-        平空单（U本位合约）
+        # 先从持仓中移除，容器里只保留未平仓的持仓；已被其他任务移除说明正在平仓
+        positions = self.long_positions if sign > 0 else self.short_positions
+        if positions.pop(position['order_id'], None) is None:
+            return
+        self._state_changed.set()
 
-        Args:
-            position: 空单信息
-            current_price: 当前价格
-            reason: 平仓原因
-        """
         try:
             position['is_open'] = False
-            amount = float(position['amount'])
+            current_price = float(current_price)
+            amount = position['amount']
 
-            # U本位合约，平空单使用 positionSide: 'SHORT'
-            order = await self.exchange.create_market_buy_order(
+            # U本位合约，通过 positionSide 指定平哪一边；平多单卖出，平空单买入
+            create_order = self.exchange.create_market_sell_order if sign > 0 else self.exchange.create_market_buy_order
+            order = await create_order(
                 self.symbol,
                 amount,
-                params={'positionSide': 'SHORT', 'reduceOnly': True}
+                params=close_params
             )
+            self._invalidate_price()
 
             # 计算盈亏（空单是反的：高卖低买盈利）
             entry_price = position['entry_price']
-            profit_amount = (entry_price - current_price) * position['amount']
-            profit_ratio = (entry_price - current_price) / entry_price
+            profit_amount = sign * (current_price - entry_price) * amount
+            profit_ratio = sign * (current_price - entry_price) / entry_price
 
             # 计算交易手续费（开仓+平仓，使用Taker费率0.04%作为保守估计）
-            fee_rate = Decimal('0.0004')  # 0.04%
-            position_value_usdt = position['amount'] * entry_price
-            total_fee_usdt = position_value_usdt * fee_rate * 2  # 开仓和平仓各一次
+            position_value_usdt = amount * (current_price if sign > 0 else entry_price)
+            total_fee_usdt = position_value_usdt * self._fee_rate_round_trip  # 开仓和平仓各一次
 
             # 计算净盈亏（扣除手续费）
             profit_amount_net = profit_amount - total_fee_usdt
-            profit_ratio_net = (entry_price - current_price) / entry_price - (total_fee_usdt / position_value_usdt)
+            profit_ratio_net = profit_ratio - (total_fee_usdt / position_value_usdt)
 
             # 更新统计
             self.trade_count += 1
@@ -640,22 +759,36 @@ class HedgeGridStrategy:
 
             if profit_amount >= 0:
                 self.total_profit += profit_amount_net
-                self.short_profit_count += 1
+                if sign > 0:
+                    self.long_profit_count += 1
+                else:
+                    self.short_profit_count += 1
                 logger.info(
-                    f"空单止盈: 入场 {entry_price}, 平仓 {current_price} | "
-                    f"毛利润 {profit_amount:.4f} USDT ({profit_ratio*100:.2f}%) | "
-                    f"手续费 {total_fee_usdt:.4f} USDT | "
-                    f"净利润 {profit_amount_net:.4f} USDT ({profit_ratio_net*100:.2f}%)"
+                    "%s止盈: 入场 %s, 平仓 %s | "
+                    "毛利润 %.4f USDT (%.2f%%) | "
+                    "手续费 %.4f USDT | "
+                    "净利润 %.4f USDT (%.2f%%)",
+                    name, entry_price, current_price,
+                    profit_amount, profit_ratio*100,
+                    total_fee_usdt,
+                    profit_amount_net, profit_ratio_net*100
                 )
             else:
                 self.total_loss += abs(profit_amount_net)
-                self.short_loss_count += 1
+                if sign > 0:
+                    self.long_loss_count += 1
+                else:
+                    self.short_loss_count += 1
                 self.update_daily_stats(abs(profit_amount_net))
                 logger.warning(
-                    f"空单止损: 入场 {entry_price}, 平仓 {current_price} | "
-                    f"毛亏损 {abs(profit_amount):.4f} USDT ({profit_ratio*100:.2f}%) | "
-                    f"手续费 {total_fee_usdt:.4f} USDT | "
-                    f"净亏损 {abs(profit_amount_net):.4f} USDT ({profit_ratio_net*100:.2f}%)"
+                    "%s止损: 入场 %s, 平仓 %s | "
+                    "毛亏损 %.4f USDT (%.2f%%) | "
+                    "手续费 %.4f USDT | "
+                    "净亏损 %.4f USDT (%.2f%%)",
+                    name, entry_price, current_price,
+                    abs(profit_amount), profit_ratio*100,
+                    total_fee_usdt,
+                    abs(profit_amount_net), profit_ratio_net*100
                 )
 
             # 记录交易
@@ -664,45 +797,39 @@ class HedgeGridStrategy:
                     'symbol': self.symbol,
                     'order_id': position['order_id'],
                     'close_order_id': order.get('id'),
-                    'type': 'short',
-                    'entry_price': float(entry_price),
-                    'exit_price': float(current_price),
-                    'amount': float(position['amount']),
-                    'profit': float(profit_amount_net),  # 使用净利润
-                    'profit_ratio': float(profit_ratio_net),  # 使用净利率
+                    'type': side,
+                    'entry_price': entry_price,
+                    'exit_price': current_price,
+                    'amount': amount,
+                    'profit': profit_amount_net,  # 使用净利润
+                    'profit_ratio': profit_ratio_net,  # 使用净利率
                     'reason': reason,
                     'timestamp': order.get('timestamp')
                 }
                 self.trade_recorder.record_trade(trade_data)
 
                 # 广播交易更新到Web界面
-                try:
-                    from web.app import broadcast_trade_update
-                    await broadcast_trade_update(trade_data)
-                except Exception as e:
-                    # Web模块可能未初始化，忽略错误
-                    pass
-
-            # 从持仓中移除
-            if position in self.short_positions:
-                self.short_positions.remove(position)
+                await self._emit(trade_data)
 
         except Exception as e:
-            logger.error(f"平空单失败: {e}")
+            logger.error("平%s失败: %s", name, e)
 
     async def check_positions(self):
         """检查所有持仓触发条件"""
-        # 更新ATR（每小时更新一次）
-        await self._update_atr()
+        # 更新ATR（仅在新K线收盘后），与获取行情并发进行
+        atr_task = asyncio.create_task(self._refresh_atr_if_due())
 
         # 风险控制检查（检查每日限制，但不检查持仓数量）
         if not self._check_risk_control_basic():
+            await atr_task
             logger.warning("风险控制触发，跳过交易")
             return
 
         # 获取当前价格
-        ticker = await self.exchange.fetch_ticker(self.symbol)
-        current_price = Decimal(str(ticker['last']))
+        try:
+            current_price = await self._get_price()
+        finally:
+            await atr_task
 
         # 检查多单触发条件
         await self.check_long_triggers(current_price)
@@ -710,38 +837,95 @@ class HedgeGridStrategy:
         # 检查空单触发条件
         await self.check_short_triggers(current_price)
 
+    async def _emit(self, trade_data: Dict):
+        """
+        广播交易更新到Web界面
+
+        Args:
+            trade_data: 交易数据
+        """
+        if self._broadcast is None:
+            try:
+                from web.app import broadcast_trade_update
+                self._broadcast = broadcast_trade_update
+            except Exception:
+                # Web模块不可用，之后不再尝试导入
+                self._broadcast = False
+
+        if self._broadcast:
+            try:
+                await self._broadcast(trade_data)
+            except Exception:
+                # Web模块可能未初始化，忽略错误
+                pass
+
+    async def _status_loop(self, debounce: float = 0.1):
+        """
+        持仓变化时向Web界面推送最新状态，短时间内的多次变化合并为一次推送
+
+        Args:
+            debounce: 合并等待时间（秒）
+        """
+        try:
+            from web.app import broadcast_status_update
+        except Exception:
+            # Web模块不可用，无需推送
+            return
+
+        state_changed = self._state_changed
+        while self.is_running:
+            await state_changed.wait()
+            await asyncio.sleep(debounce)
+            state_changed.clear()
+            # 持仓已变化，跳过Web端的状态缓存（广播函数内部已处理异常）
+            await broadcast_status_update(fresh=True)
+
     async def cancel_all_orders(self):
         """取消所有挂单"""
         logger.info("取消所有挂单...")
         try:
+            # 交易所支持一次性撤销全部挂单时只需一次请求
+            if getattr(self.exchange, 'has', {}).get('cancelAllOrders'):
+                await self.exchange.cancel_all_orders(self.symbol)
+                logger.info("已取消 %s 全部挂单", self.symbol)
+                return
+
             orders = await self.exchange.fetch_open_orders(self.symbol)
-            for order in orders:
-                try:
-                    await self.exchange.cancel_order(order['id'], self.symbol)
-                    logger.info(f"取消订单: {order['id']}")
-                except Exception as e:
-                    logger.error(f"取消订单失败 {order['id']}: {e}")
+            # 并发取消，耗时约为一次请求往返
+            await asyncio.gather(*(self._cancel_one(order['id']) for order in orders))
         except Exception as e:
-            logger.error(f"取消挂单失败: {e}")
+            logger.error("取消挂单失败: %s", e)
 
-    async def close_all_positions(self, current_price: Decimal):
+    async def _cancel_one(self, order_id: str):
+        """
+        取消单个挂单
+
+        Args:
+            order_id: 订单ID
+        """
+        try:
+            await self.exchange.cancel_order(order_id, self.symbol)
+            logger.info("取消订单: %s", order_id)
+        except Exception as e:
+            logger.error("取消订单失败 %s: %s", order_id, e)
+
+    async def close_all_positions(self, current_price: float):
         """
         平仓所有持仓
 
         Args:
             current_price: 当前价格
         """
+        current_price = float(current_price)
         logger.info("平仓所有持仓...")
 
-        # 平所有多单
-        for position in list(self.long_positions):
-            if position['is_open']:
-                await self._close_long_position(position, current_price, reason="策略停止")
-
-        # 平所有空单
-        for position in list(self.short_positions):
-            if position['is_open']:
-                await self._close_short_position(position, current_price, reason="策略停止")
+        # 多单和空单的平仓请求互不依赖，并发发出
+        await asyncio.gather(
+            *(self._close_position(position, current_price, 'long', reason="策略停止")
+              for position in list(self.long_positions.values())),
+            *(self._close_position(position, current_price, 'short', reason="策略停止")
+              for position in list(self.short_positions.values()))
+        )
 
         logger.info("所有持仓已平仓")
 
@@ -758,13 +942,13 @@ class HedgeGridStrategy:
 
         # 检查每日最大亏损
         if self.daily_loss >= self.max_daily_loss:
-            logger.warning(f"已达到每日最大亏损限制: {self.daily_loss}/{self.max_daily_loss} USDT")
+            logger.warning("已达到每日最大亏损限制: %s/%s USDT", self.daily_loss, self.max_daily_loss)
             self.is_paused = True
             return False
 
         # 检查每日最大交易次数
         if self.daily_trades >= self.max_daily_trades:
-            logger.warning(f"已达到每日最大交易次数: {self.daily_trades}/{self.max_daily_trades}")
+            logger.warning("已达到每日最大交易次数: %s/%s", self.daily_trades, self.max_daily_trades)
             self.is_paused = True
             return False
 
@@ -784,12 +968,12 @@ class HedgeGridStrategy:
         # 检查最大持仓数量
         total_positions = len(self.long_positions) + len(self.short_positions)
         if total_positions >= self.max_positions * 2:  # 乘2因为多空各算
-            logger.warning(f"已达到最大持仓数量: {total_positions}/{self.max_positions * 2}")
+            logger.warning("已达到最大持仓数量: %s/%s", total_positions, self.max_positions * 2)
             return False
 
         return True
 
-    def update_daily_stats(self, loss: Decimal):
+    def update_daily_stats(self, loss: float):
         """
         更新每日统计
 
@@ -801,72 +985,93 @@ class HedgeGridStrategy:
 
     def reset_daily_stats(self):
         """重置每日统计"""
-        self.daily_loss = Decimal('0')
+        self.daily_loss = 0.0
         self.daily_trades = 0
         self.is_paused = False
         logger.info("每日统计已重置")
 
-    async def get_status(self) -> Dict[str, Any]:
+    async def get_status(self, with_details: bool = False) -> Dict[str, Any]:
         """
         获取策略状态
 
+        Args:
+            with_details: 是否附带各持仓的止盈止损明细（仅供主循环输出日志，不对外提供）
+
         Returns:
             策略状态字典
         """
-        ticker = await self.exchange.fetch_ticker(self.symbol)
-        current_price = Decimal(str(ticker['last']))
+        current_price = await self._get_price()
 
-        # 计算当前持仓盈亏
-        long_pnl = Decimal('0')
-        for position in self.long_positions:
-            if position['is_open']:
-                long_pnl += (current_price - position['entry_price']) * position['amount']
+        # 一次遍历同时统计持仓数量、浮动盈亏（需要时顺带生成止盈止损明细）
+        # 明细为 (入场价, 止盈价, 止损价, 距止盈%, 距止损%)
+        pct = 100 / current_price
 
-        short_pnl = Decimal('0')
-        for position in self.short_positions:
-            if position['is_open']:
-                short_pnl += (position['entry_price'] - current_price) * position['amount']
+        long_count = 0
+        long_pnl = 0.0
+        long_details = []
+        for position in self.long_positions.values():
+            entry_price = position['entry_price']
+            long_count += 1
+            long_pnl += (current_price - entry_price) * position['amount']
+            if with_details:
+                tp_price = self._calculate_long_take_profit(position)
+                sl_price = self._calculate_long_stop_loss(position)
+                long_details.append((entry_price, tp_price, sl_price,
+                                     (tp_price - current_price) * pct, (current_price - sl_price) * pct))
+
+        short_count = 0
+        short_pnl = 0.0
+        short_details = []
+        for position in self.short_positions.values():
+            entry_price = position['entry_price']
+            short_count += 1
+            short_pnl += (entry_price - current_price) * position['amount']
+            if with_details:
+                tp_price = self._calculate_short_take_profit(position)
+                sl_price = self._calculate_short_stop_loss(position)
+                short_details.append((entry_price, tp_price, sl_price,
+                                      (current_price - tp_price) * pct, (sl_price - current_price) * pct))
 
         total_pnl = long_pnl + short_pnl
 
-        return {
+        status = {
             'symbol': self.symbol,
             'is_running': self.is_running,
-            'current_price': float(current_price),
-            'current_atr': float(self.current_atr),
+            'current_price': current_price,
+            'current_atr': self.current_atr,
             'positions': {
-                'long_count': len([p for p in self.long_positions if p['is_open']]),
-                'short_count': len([p for p in self.short_positions if p['is_open']]),
-                'long_pnl': float(long_pnl),
-                'short_pnl': float(short_pnl),
-                'total_pnl': float(total_pnl)
-            },
-            'thresholds': {
-                'up_threshold': self._get_threshold_desc('up'),
-                'down_threshold': self._get_threshold_desc('down'),
-                'stop_loss': self._get_threshold_desc('stop_loss')
+                'long_count': long_count,
+                'short_count': short_count,
+                'long_pnl': long_pnl,
+                'short_pnl': short_pnl,
+                'total_pnl': total_pnl
             },
+            'thresholds': dict(self._threshold_desc),
             'stats': {
                 'total_trades': self.trade_count,
                 'long_profit_count': self.long_profit_count,
                 'long_loss_count': self.long_loss_count,
                 'short_profit_count': self.short_profit_count,
                 'short_loss_count': self.short_loss_count,
-                'total_profit': float(self.total_profit),
-                'total_loss': float(self.total_loss),
-                'net_profit': float(self.total_profit - self.total_loss)
+                'total_profit': self.total_profit,
+                'total_loss': self.total_loss,
+                'net_profit': self.total_profit - self.total_loss
             },
             'daily': {
-                'daily_loss': float(self.daily_loss),
+                'daily_loss': self.daily_loss,
                 'daily_trades': self.daily_trades,
                 'is_paused': self.is_paused
             },
             'risk_control': {
                 'max_positions': self.max_positions,
-                'max_daily_loss': float(self.max_daily_loss),
+                'max_daily_loss': self.max_daily_loss,
                 'max_daily_trades': self.max_daily_trades
             }
         }
+        if with_details:
+            status['long_details'] = long_details
+            status['short_details'] = short_details
+        return status
 
     async def start(self):
         """启动策略"""
@@ -880,6 +1085,14 @@ class HedgeGridStrategy:
         # 初始化
         await self.initialize()
 
+        # 订阅行情推送
+        if getattr(self.exchange, 'has', {}).get('watchTicker'):
+            self._price_task = asyncio.create_task(self._watch_price())
+            logger.info("已订阅行情推送: %s", self.symbol)
+
+        # 持仓变化时推送状态
+        self._status_task = asyncio.create_task(self._status_loop())
+
         # 开启初始多空单
         await self.open_initial_positions()
 
@@ -893,11 +1106,22 @@ class HedgeGridStrategy:
         logger.info("停止双向持仓策略...")
 
         # 获取当前价格并平仓
-        ticker = await self.exchange.fetch_ticker(self.symbol)
-        current_price = Decimal(str(ticker['last']))
+        current_price = await self._get_price()
         await self.close_all_positions(current_price)
 
         self.is_running = False
+
+        # 取消行情推送
+        if self._price_task is not None:
+            self._price_task.cancel()
+            self._price_task = None
+        self._price_streaming = False
+
+        # 停止状态推送
+        if self._status_task is not None:
+            self._status_task.cancel()
+            self._status_task = None
+
         logger.info("双向持仓策略已停止")
 
     def get_positions_info(self) -> List[Dict]:
@@ -910,24 +1134,22 @@ class HedgeGridStrategy:
         positions = []
 
         # 多单信息
-        for p in self.long_positions:
-            if p['is_open']:
-                positions.append({
-                    'type': 'long',
-                    'entry_price': float(p['entry_price']),
-                    'amount': float(p['amount']),
-                    'entry_time': p['entry_time']
-                })
+        for p in self.long_positions.values():
+            positions.append({
+                'type': 'long',
+                'entry_price': float(p['entry_price']),
+                'amount': float(p['amount']),
+                'entry_time': p['entry_time']
+            })
 
         # 空单信息
-        for p in self.short_positions:
-            if p['is_open']:
-                positions.append({
-                    'type': 'short',
-                    'entry_price': float(p['entry_price']),
-                    'amount': float(p['amount']),
-                    'entry_time': p['entry_time']
-                })
+        for p in self.short_positions.values():
+            positions.append({
+                'type': 'short',
+                'entry_price': float(p['entry_price']),
+                'amount': float(p['amount']),
+                'entry_time': p['entry_time']
+            })
 
         return positions
 
@@ -938,80 +1160,112 @@ class HedgeGridStrategy:
         Args:
             check_interval: 检查间隔（秒）
         """
-        logger.info(f"策略主循环已启动，检查间隔: {check_interval}秒")
+        logger.info("策略主循环已启动，检查间隔: %s秒", check_interval)
+
+        # 循环内用到的方法先取到局部变量，避免每轮重复查找属性
+        monotonic = time.monotonic
+        get_status = self.get_status
+        check_positions = self.check_positions
+        log_position_details = self._log_position_details
+        price_event = self._price_event
 
+        # Web状态广播函数只解析一次（Web模块不可用时为None）
+        try:
+            from web.app import broadcast_status_update
+        except Exception:
+            broadcast_status_update = None
+
+        next_report = 0.0
+        backoff = 1  # 限频退避时间（秒），成功一轮后重置
         try:
             while self.is_running:
+                # 到达检查间隔时输出状态并广播，其余时间只检查触发条件
+                report = monotonic() >= next_report
+                if report:
+                    next_report = monotonic() + check_interval
+                price_event.clear()
+
                 try:
-                    # 显示策略状态
-                    status = await self.get_status()
-                    logger.info(
-                        f"价格: {status['current_price']} | "
-                        f"ATR: {status['current_atr']:.4f} | "
-                        f"多单: {status['positions']['long_count']} | "
-                        f"空单: {status['positions']['short_count']} | "
-                        f"浮盈: {status['positions']['total_pnl']:.2f} | "
-                        f"总交易: {status['stats']['total_trades']}"
-                    )
-
-                    # 显示详细的持仓信息（包括止盈止损价格）
-                    self._log_position_details(status['current_price'])
+                    if report and logger.isEnabledFor(logging.INFO):
+                        # 显示策略状态（未开启INFO日志时连同状态查询一起跳过）
+                        status = await get_status(with_details=True)
+                        logger.info(
+                            "价格: %s | "
+                            "ATR: %.4f | "
+                            "多单: %s | "
+                            "空单: %s | "
+                            "浮盈: %.2f | "
+                            "总交易: %s",
+                            status['current_price'],
+                            status['current_atr'],
+                            status['positions']['long_count'],
+                            status['positions']['short_count'],
+                            status['positions']['total_pnl'],
+                            status['stats']['total_trades']
+                        )
+
+                        # 显示详细的持仓信息（包括止盈止损价格）
+                        log_position_details(status)
 
                     # 检查持仓触发条件
-                    await self.check_positions()
+                    await check_positions()
 
-                    # 广播状态更新到Web界面
-                    try:
-                        from web.app import broadcast_status_update
+                    if report and broadcast_status_update is not None:
+                        # 广播状态更新到Web界面（广播函数内部已处理异常）
                         await broadcast_status_update()
-                    except Exception as e:
-                        # Web模块可能未初始化，忽略错误
-                        pass
 
+                    backoff = 1
+
+                except (ccxt.RateLimitExceeded, ccxt.DDoSProtection) as e:
+                    # 触发限频：指数退避，最长60秒
+                    logger.warning("触发交易所限频，%s秒后重试: %s", backoff, e)
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, 60)
+                    continue
+                except ccxt.NetworkError as e:
+                    # 网络抖动：短暂等待后立即重试
+                    logger.warning("网络异常，1秒后重试: %s", e)
+                    await asyncio.sleep(1)
+                    continue
                 except Exception as e:
-                    logger.error(f"主循环异常: {e}", exc_info=True)
+                    logger.error("主循环异常: %s", e, exc_info=True)
 
-                # 等待下一次检查
-                await asyncio.sleep(check_interval)
+                # 等待下一次行情推送或下一次状态输出（未启用推送时即按检查间隔轮询）
+                timeout = max(next_report - monotonic(), 0)
+                if self._price_streaming:
+                    try:
+                        await asyncio.wait_for(price_event.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await asyncio.sleep(timeout)
 
         except asyncio.CancelledError:
             logger.info("主循环已取消")
 
         logger.info("策略主循环已结束")
 
-    def _log_position_details(self, current_price: Decimal):
+    def _log_position_details(self, status: Dict[str, Any]):
         """
         记录详细的持仓信息（包括止盈止损价格）
 
         Args:
-            current_price: 当前价格
+            status: get_status(with_details=True) 返回的状态，止盈止损明细已在其中计算好
         """
         # 多单详情
-        for idx, position in enumerate(self.long_positions):
-            if position['is_open']:
-                tp_price = self._calculate_long_take_profit(position)
-                sl_price = self._calculate_long_stop_loss(position)
-
-                distance_to_tp = ((tp_price - current_price) / current_price) * 100
-                distance_to_sl = ((current_price - sl_price) / current_price) * 100
-
-                logger.info(
-                    f"  多单{idx+1}: 入场={position['entry_price']} | "
-                    f"止盈={tp_price} (+{distance_to_tp:.2f}%) | "
-                    f"止损={sl_price} (-{distance_to_sl:.2f}%)"
-                )
+        for idx, (entry_price, tp_price, sl_price, distance_to_tp, distance_to_sl) in enumerate(status['long_details']):
+            logger.info(
+                "  多单%s: 入场=%s | "
+                "止盈=%s (+%.2f%%) | "
+                "止损=%s (-%.2f%%)",
+                idx+1, entry_price, tp_price, distance_to_tp, sl_price, distance_to_sl
+            )
 
         # 空单详情
-        for idx, position in enumerate(self.short_positions):
-            if position['is_open']:
-                tp_price = self._calculate_short_take_profit(position)
-                sl_price = self._calculate_short_stop_loss(position)
-
-                distance_to_tp = ((current_price - tp_price) / current_price) * 100
-                distance_to_sl = ((sl_price - current_price) / current_price) * 100
-
-                logger.info(
-                    f"  空单{idx+1}: 入场={position['entry_price']} | "
-                    f"止盈={tp_price} (-{distance_to_tp:.2f}%) | "
-                    f"止损={sl_price} (+{distance_to_sl:.2f}%)"
-                )
+        for idx, (entry_price, tp_price, sl_price, distance_to_tp, distance_to_sl) in enumerate(status['short_details']):
+            logger.info(
+                "  空单%s: 入场=%s | "
+                "止盈=%s (-%.2f%%) | "
+                "止损=%s (+%.2f%%)",
+                idx+1, entry_price, tp_price, distance_to_tp, sl_price, distance_to_sl
+            )
@@ -1,27 +1,50 @@
 """
 日志配置模块
 """
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 
+# 后台写日志的监听线程（重复调用 setup_logging 时先停止旧的）
+_listener = None
+
+
+def _stop_listener():
+    """停止后台日志线程，写完队列中剩余的日志"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(
     log_file='logs/trading.log',
     log_level=logging.INFO,
     max_bytes=10*1024*1024,  # 10MB
     backup_count=5
-):
+) -> QueueListener:
     """
     配置日志系统
 
+    日志记录先放入队列，由后台线程写入文件和控制台，
+    写盘和日志轮转不会阻塞事件循环
+
     Args:
         log_file: 日志文件路径
         log_level: 日志级别
         max_bytes: 单个日志文件最大字节数
         backup_count: 保留的日志文件数量
+
+    Returns:
+        后台日志监听器（程序退出时自动停止并写完剩余日志，无需手动调用 stop）
     """
+    global _listener
     # 确保日志目录存在
     log_dir = os.path.dirname(log_file)
     if log_dir:
@@ -44,6 +67,7 @@ def setup_logging(
 
     # 清除现有处理器
     root_logger.handlers.clear()
+    _stop_listener()
 
     # 文件处理器（支持日志轮转）
     file_handler = RotatingFileHandler(
@@ -54,18 +78,24 @@ def setup_logging(
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
 
     # 控制台处理器
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+
+    # 根日志记录器只挂队列处理器，实际输出在后台线程完成
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
 
     # 设置交易所库的日志级别（减少噪音）
     logging.getLogger('ccxt').setLevel(logging.WARNING)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
 
+    return _listener
+
 
 def get_logger(name: str) -> logging.Logger:
     """
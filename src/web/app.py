@@ -3,18 +3,36 @@ Web管理界面 - FastAPI应用
 """
 import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import json
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-# 创建FastAPI应用
-app = FastAPI(title="币安双向持仓策略管理系统", version="1.0.0")
+# 创建FastAPI应用（有 orjson 时接口响应使用 orjson 序列化）
+app = FastAPI(
+    title="币安双向持仓策略管理系统",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
+)
+
+
+def _dumps_text(message: dict) -> str:
+    """将WebSocket消息序列化为紧凑的JSON文本"""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
 
 # CORS中间件
 app.add_middleware(
@@ -25,11 +43,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 主页内容在启动时读取一次，之后每次请求直接返回
+try:
+    _INDEX_HTML = (Path(__file__).parent / "index.html").read_bytes()
+except FileNotFoundError:
+    _INDEX_HTML = "<h1>Web管理界面加载失败</h1><p>请确保 src/web/index.html 文件存在</p>".encode("utf-8")
+
 # 全局变量：存储策略实例
 strategy_instance = None
 trade_recorder = None
 config_manager = None
 
+# 策略状态缓存（有效期内的查询和广播共用一次 get_status）
+_STATUS_TTL = 0.5
+_status_cache: Dict[str, Any] = {'ts': 0.0, 'value': None, 'lock': asyncio.Lock()}
+
+
+async def _cached_status(fresh: bool = False) -> Dict[str, Any]:
+    """
+    获取策略状态，缓存未过期时直接返回；并发调用只会触发一次查询
+
+    Args:
+        fresh: 是否忽略缓存重新查询（持仓刚发生变化时使用）
+
+    Returns:
+        策略状态字典
+    """
+    if not fresh and time.monotonic() - _status_cache['ts'] < _STATUS_TTL:
+        return _status_cache['value']
+
+    async with _status_cache['lock']:
+        # 等锁期间其他调用可能已经刷新了缓存
+        if not fresh and time.monotonic() - _status_cache['ts'] < _STATUS_TTL:
+            return _status_cache['value']
+
+        status = await strategy_instance.get_status()
+        _status_cache['value'] = status
+        _status_cache['ts'] = time.monotonic()
+        return status
+
+
+# 交易历史缓存（按条数缓存，有新成交时作废；gen 每次作废加一，防止作废前发起的读取写回旧结果）
+_TRADES_TTL = 1.0
+_trades_cache: Dict[str, Any] = {'ts': 0.0, 'limit': None, 'value': None, 'gen': 0}
+
 # WebSocket连接管理
 class ConnectionManager:
     """WebSocket连接管理器"""
@@ -52,17 +109,29 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """发送个人消息"""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(_dumps_text(message))
         except Exception as e:
             logger.error(f"发送WebSocket消息失败: {e}")
 
     async def broadcast(self, message: dict):
-        """广播消息给所有连接"""
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"广播消息失败: {e}")
+        """广播消息给所有连接（只序列化一次，并发发送，发送失败的连接直接移除）"""
+        connections = list(self.active_connections)
+        if not connections:
+            return
+
+        text = _dumps_text(message)
+        results = await asyncio.gather(
+            *(connection.send_text(text) for connection in connections),
+            return_exceptions=True
+        )
+
+        failed = [c for c, r in zip(connections, results) if isinstance(r, Exception)]
+        if failed:
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"广播消息失败: {result}")
+            self.active_connections = [c for c in self.active_connections if c not in failed]
+            logger.info(f"已移除失效的WebSocket连接 {len(failed)} 个，当前连接数: {len(self.active_connections)}")
 
 
 manager = ConnectionManager()
@@ -87,11 +156,7 @@ def init_strategy(strategy, recorder, config_mgr):
 @app.get("/")
 async def root():
     """主页 - 返回Web管理界面"""
-    try:
-        with open("src/web/index.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
-        return HTMLResponse(content="<h1>Web管理界面加载失败</h1><p>请确保 src/web/index.html 文件存在</p>")
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 @app.get("/api/status")
@@ -101,7 +166,7 @@ async def get_status():
         raise HTTPException(status_code=503, detail="策略未初始化")
 
     try:
-        status = await strategy_instance.get_status()
+        status = await _cached_status()
         return {"success": True, "data": status}
     except Exception as e:
         logger.error(f"获取策略状态失败: {e}")
@@ -129,7 +194,16 @@ async def get_trades(limit: int = 100):
         raise HTTPException(status_code=503, detail="交易记录器未初始化")
 
     try:
-        trades = trade_recorder.get_recent_trades(limit)
+        cache = _trades_cache
+        if cache['limit'] == limit and time.monotonic() - cache['ts'] < _TRADES_TTL:
+            trades = cache['value']
+        else:
+            # 读取交易记录文件会阻塞，放到线程中执行
+            gen = cache['gen']
+            trades = await asyncio.to_thread(trade_recorder.load_trades, limit)
+            # 读取期间有新成交时结果可能已过时，不写入缓存
+            if cache['gen'] == gen:
+                cache.update(ts=time.monotonic(), limit=limit, value=trades)
         return {"success": True, "data": trades}
     except Exception as e:
         logger.error(f"获取交易历史失败: {e}")
@@ -162,10 +236,8 @@ async def open_long_position():
         raise HTTPException(status_code=503, detail="策略未初始化")
 
     try:
-        # 获取当前价格
-        from decimal import Decimal
-        ticker = await strategy_instance.exchange.fetch_ticker(strategy_instance.symbol)
-        current_price = Decimal(str(ticker['last']))
+        # 获取当前价格（优先使用策略的行情推送/价格缓存）
+        current_price = await strategy_instance.get_price()
 
         # 开多单
         await strategy_instance._open_long_position(current_price)
@@ -183,10 +255,8 @@ async def open_short_position():
         raise HTTPException(status_code=503, detail="策略未初始化")
 
     try:
-        # 获取当前价格
-        from decimal import Decimal
-        ticker = await strategy_instance.exchange.fetch_ticker(strategy_instance.symbol)
-        current_price = Decimal(str(ticker['last']))
+        # 获取当前价格（优先使用策略的行情推送/价格缓存）
+        current_price = await strategy_instance.get_price()
 
         # 开空单
         await strategy_instance._open_short_position(current_price)
@@ -204,10 +274,8 @@ async def close_all_positions():
         raise HTTPException(status_code=503, detail="策略未初始化")
 
     try:
-        # 获取当前价格
-        from decimal import Decimal
-        ticker = await strategy_instance.exchange.fetch_ticker(strategy_instance.symbol)
-        current_price = Decimal(str(ticker['last']))
+        # 获取当前价格（优先使用策略的行情推送/价格缓存）
+        current_price = await strategy_instance.get_price()
 
         # 平所有持仓
         await strategy_instance.close_all_positions(current_price)
@@ -262,11 +330,16 @@ async def websocket_endpoint(websocket: WebSocket):
         manager.disconnect(websocket)
 
 
-async def broadcast_status_update():
-    """广播策略状态更新"""
+async def broadcast_status_update(fresh: bool = False):
+    """
+    广播策略状态更新
+
+    Args:
+        fresh: 是否忽略状态缓存重新查询
+    """
     if strategy_instance and manager.active_connections:
         try:
-            status = await strategy_instance.get_status()
+            status = await _cached_status(fresh)
             message = {
                 "type": "status_update",
                 "data": status,
@@ -279,6 +352,10 @@ async def broadcast_status_update():
 
 async def broadcast_trade_update(trade_data: dict):
     """广播交易更新"""
+    # 有新成交，交易历史缓存作废
+    _trades_cache['ts'] = 0.0
+    _trades_cache['gen'] += 1
+
     if manager.active_connections:
         try:
             message = {